@@ -7,11 +7,192 @@ import omni.ext
 import omni.ui as ui
 import omni.usd
 import omni.kit.app
-from pxr import Gf, UsdGeom, Usd
+from pxr import Gf, UsdGeom, Usd, Sdf, Tf
+import functools
 import math
+import time
+import numpy as np
 from omni.debugdraw import get_debug_draw_interface
 import omni.physx
 
+
+def _rf_select(tower_xyz, ant_xyz):
+    """Rank towers by distance to an antenna; returns (nearest-first indices, squared distances)."""
+    diff = tower_xyz - ant_xyz
+    distances_sq = np.einsum("ij,ij->i", diff, diff)
+    return np.argsort(distances_sq, kind="stable"), distances_sq
+
+
+def _interp_waypoint(progress, poses, out):
+    """Piecewise-linear pose at progress (0.0 to 1.0) along (K, D) waypoint poses, written into out (D,)."""
+    num_segments = poses.shape[0] - 1
+    scaled = min(max(progress, 0.0), 1.0) * num_segments
+    segment_index = min(int(scaled), num_segments - 1)
+    start = poses[segment_index]
+    # start + (end - start) * t, in place
+    np.subtract(poses[segment_index + 1], start, out=out)
+    out *= scaled - segment_index
+    out += start
+    return out
+
+
+def _set_translate(xform_op, pose):
+    pose['translation'] = xform_op.Get()
+
+
+def _set_rotate_xyz(xform_op, pose):
+    pose['rotation_euler'] = xform_op.Get()
+
+
+def _set_rotate_x(xform_op, pose):
+    pose['rotation_euler'][0] = xform_op.Get()
+
+
+def _set_rotate_y(xform_op, pose):
+    pose['rotation_euler'][1] = xform_op.Get()
+
+
+def _set_rotate_z(xform_op, pose):
+    pose['rotation_euler'][2] = xform_op.Get()
+
+
+# XformOp type -> handler that reads the op into a waypoint pose dict
+_OP_HANDLERS = {
+    UsdGeom.XformOp.TypeTranslate: _set_translate,
+    UsdGeom.XformOp.TypeRotateXYZ: _set_rotate_xyz,
+    UsdGeom.XformOp.TypeRotateX: _set_rotate_x,
+    UsdGeom.XformOp.TypeRotateY: _set_rotate_y,
+    UsdGeom.XformOp.TypeRotateZ: _set_rotate_z,
+}
+
+# XformOp type -> slot of the aircraft op driven by update_aircraft_transform
+_AIRCRAFT_OP_SLOTS = {
+    UsdGeom.XformOp.TypeTranslate: "translate",
+    UsdGeom.XformOp.TypeRotateXYZ: "rotate",
+}
+
+
+class _Throttled:
+    """Call fn at most once per timeout; a burst collapses to its latest value, emitted on an update tick."""
+    
+    def __init__(self, fn, timeout_ms, leading=True, trailing=True):
+        self._fn = fn
+        self._timeout = timeout_ms / 1000.0
+        self._leading = leading
+        self._trailing = trailing
+        self._last_emit = -math.inf
+        self._pending = False
+        self._pending_value = None
+        self._sub = None
+    
+    def __call__(self, value):
+        now = time.perf_counter()
+        idle = not self._pending and now - self._last_emit >= self._timeout
+        if idle and self._leading:
+            self._emit(value, now)
+            return
+        if not self._trailing:
+            return
+        if idle:
+            self._last_emit = now  # Without a leading call, the window opens with this event
+        self._pending = True
+        self._pending_value = value
+        if not self._sub:
+            stream = omni.kit.app.get_app().get_update_event_stream()
+            self._sub = stream.create_subscription_to_pop(self._on_tick, name="throttled_trailing_call")
+    
+    def _on_tick(self, e):
+        now = time.perf_counter()
+        if self._pending and now - self._last_emit < self._timeout:
+            return
+        # The burst is over: drop the per-frame callback until the next one
+        self._release_sub()
+        if self._pending:
+            self._emit(self._pending_value, now)
+    
+    def _release_sub(self):
+        if self._sub:
+            self._sub.unsubscribe()
+            self._sub = None
+    
+    def _emit(self, value, now):
+        self._pending = False
+        self._pending_value = None
+        self._last_emit = now
+        self._fn(value)
+    
+    def destroy(self):
+        self._pending = False
+        self._pending_value = None
+        self._release_sub()
+
+
+def throttled(fn, timeout_ms=75, leading=True, trailing=True):
+    """Wrap fn so rapid calls (e.g. slider drags) run it at most every timeout_ms, always ending on the last value."""
+    return _Throttled(fn, timeout_ms, leading=leading, trailing=trailing)
+
+
+# Dashboard row pitch and status-disk diameter, in pixels
+_ROW_HEIGHT = 48
+_STATUS_DOT = 18
+_TITLE_HEIGHT = 60
+_TITLE_GAP = 12
+_HEADER_HEIGHT = 42
+_TOWER_ROWS_TOP = _TITLE_HEIGHT + _TITLE_GAP + _HEADER_HEIGHT  # Content y of the first antenna row
+_TOWER_LEFT_MARGIN = 20  # Leading spacer of the header and every row
+
+# Dashboard header columns as (title, width) and their hover text
+_HEADER_COLUMNS = (
+    ("ANTENNA", 220),
+    ("STATE", 130),
+    ("TYPE", 160),
+    ("FREQUENCY", 150),
+    ("LOS", 65),
+    ("LOCKED", 80),
+    ("CURRENT ZONE", 150),
+    ("POSITION (X, Y, Z)", 0),
+)
+_HEADER_TOOLTIPS = {
+    "ANTENNA": "Aircraft antenna identifier\nEach antenna has a unique designation\nbased on its function and location on the aircraft",
+    "STATE": "Current signal state:\nON (operational)\nDEGRADED (partial signal)\nOFF (no signal)",
+    "TYPE": "Antenna system type\nIndicates the communication or navigation\nsystem this antenna belongs to",
+    "FREQUENCY": "Operating frequency band\nThe radio frequency range this antenna\ntransmits and receives on",
+    "LOS": "Line of Sight Required\nYES: needs clear view of sky/transmitter\nNO: can work through obstacles",
+    "LOCKED": "Policy Locked\nYES: subject to security policy,\ndisabled in secure zones\nNO: ignores security restrictions",
+    "CURRENT ZONE": "Current RF policy zone:\nRF BLOCKING (signal blocked)\nRF ATTENUATION (signal degraded)\nSECURE+LOCKED (security zone active)\nSECURE ZONE (in security area)\nCLEAR (no restrictions)",
+    "POSITION (X, Y, Z)": "World-space coordinates of antenna in centimeters\nUpdates in real-time as aircraft moves",
+}
+_TOWER_STATUS_X = _TOWER_LEFT_MARGIN + _HEADER_COLUMNS[0][1]  # Row x of the status disk slot, which opens the STATE column
+_BOLD = {"font_weight": "bold"}
+_TOWER_FRAME_STYLE = {
+    "Tooltip": {
+        "background_color": 0xFF000000,
+        "color": 0xFFFFFFFF,
+        "border_radius": 4,
+        "padding": 12,
+        "font_size": 19
+    }
+}
+_ROW_STYLES = ({"background_color": 0xFF303030}, {"background_color": 0xFF1A1A1A})  # Even, odd row backgrounds
+
+
+def _abgr_to_rgba(color):
+    """Convert an omni.ui ABGR color int into an RGBA byte tuple for image providers."""
+    return (color & 0xFF, (color >> 8) & 0xFF, (color >> 16) & 0xFF, (color >> 24) & 0xFF)
+
+
+def _disk_template(size, color):
+    """(size, size, 4) uint8 RGBA tile of an anti-aliased disk in an omni.ui ABGR color, transparent outside."""
+    center = (size - 1) / 2.0
+    y, x = np.ogrid[:size, :size]
+    coverage = np.clip(size / 2.0 + 0.5 - np.sqrt((x - center) ** 2 + (y - center) ** 2), 0.0, 1.0)
+    r, g, b, a = _abgr_to_rgba(color)
+    tile = np.zeros((size, size, 4), dtype=np.uint8)
+    tile[..., :3] = (r, g, b)
+    tile[..., 3] = np.rint(coverage * a).astype(np.uint8)
+    return tile
+
+
 class Airport_Extension(omni.ext.IExt):
     def on_startup(self, ext_id):
         print("\n" + "="*70)
@@ -30,9 +211,12 @@ class Airport_Extension(omni.ext.IExt):
             "/World/Waypoints/Waypoint_70",
             "/World/Waypoints/Waypoint_80",
         ]
+        self._WAYPOINT_PROGRESS = tuple(i / (len(self.WAYPOINT_PATHS) - 1) for i in range(len(self.WAYPOINT_PATHS)))  # Slider value at each waypoint
         self.AXIS_MAP = [0, 2, 1]  # Map waypoint (X,Y,Z) to aircraft (X,Z,Y)
+        self._axis_idx = np.array(self.AXIS_MAP)
         
         # ==================== RF VISUALIZATION CONFIGURATION ====================
+        self.TOWERS_ROOT = "/World/Towers"
         self.ANTENNAS_VIS = [
             "/World/Aircraft/Antennas/ANT_VHF_COMM_TOP",
             "/World/Aircraft/Antennas/ANT_VHF_COMM_BOTTOM",
@@ -45,6 +229,7 @@ class Airport_Extension(omni.ext.IExt):
         self.COLOR_YELLOW = 0xFFFFFF00
         self.COLOR_RED = 0xFFFF0000
         self.COLOR_BLOCKED = 0xFFAA0000
+        self.RF_UPDATE_HZ = 10  # Tower selection + raycasts; rays are still drawn every frame
         
         # ==================== CAMERA CONFIGURATION ====================
         self.CAMERA_PATHS = [
@@ -56,6 +241,7 @@ class Airport_Extension(omni.ext.IExt):
         
         # ==================== CONTROL TOWER CONFIGURATION ====================
         self.ANTENNA_ROOT = "/World/Aircraft/Antennas"
+        self.TOWER_UPDATE_HZ = 15  # Antenna state + dashboard refresh rate (wall clock)
         self.VOLUMES = {
             "block": "/World/Volumes/RF_BLOCKING_VOLUME",
             "atten": "/World/Volumes/RF_ATTENUATION_VOLUME",
@@ -66,6 +252,8 @@ class Airport_Extension(omni.ext.IExt):
             "ANT_VHF_COMM_TOP", "ANT_VHF_COMM_BOTTOM", "ANT_ATC_TRANSPONDER",
             "ANT_DME", "ANT_WEATHER_RADAR", "ANT_HF_LONG_RANGE", "ANT_ELT"
         ]
+        self._ant_paths = tuple(f"{self.ANTENNA_ROOT}/{name}" for name in self.ANTENNA_NAMES)  # Same order as ANTENNA_NAMES
+        self.ANTENNA_ATTRS = ["signal_state", "policy_locked", "frequency_band", "requires_LOS", "antenna:type"]
         self.ANTENNA_DESCRIPTIONS = {
             "ANT_SATCOM_PRIMARY": "Satellite Communication\nPrimary antenna for high-bandwidth satellite connectivity (Ka/Ku/L-band)\nUsed for data links, internet, and communications\nwith ground stations via satellite",
             "ANT_GNSS_1": "Global Navigation Satellite System (Primary GPS)\nReceives signals from GPS, GLONASS, Galileo satellites\nfor precise positioning and navigation",
@@ -78,35 +266,90 @@ class Airport_Extension(omni.ext.IExt):
             "ANT_HF_LONG_RANGE": "HF Long Range Communication\nHigh Frequency radio for long-distance communication\nover oceans and remote areas where VHF is out of range (3-30 MHz)",
             "ANT_ELT": "Emergency Locator Transmitter\nDistress beacon that transmits on 406 MHz and 121.5 MHz\nto alert search and rescue services in case of crash or emergency"
         }
+        self._ANT_TOOLTIPS = tuple(self.ANTENNA_DESCRIPTIONS.get(name, "") for name in self.ANTENNA_NAMES)  # Row-aligned with ANTENNA_NAMES
         self.STATE_COLORS = {
             "ON": 0xFF00FF00,
             "DEGRADED": 0xFF00FFFF,
             "OFF": 0xFF0000FF,
             "UNKNOWN": 0xFF777777
         }
+        self._status_dots = {state: _disk_template(_STATUS_DOT, color) for state, color in self.STATE_COLORS.items()}
+        self._locked_styles = {
+            "YES": {"font_size": 14, "color": 0xFF0000FF, "font_weight": "bold"},
+            "NO": {"font_size": 14, "color": 0xFF00FF00, "font_weight": "bold"},
+        }
+        self._zone_styles = {
+            "RF BLOCKING": {"font_size": 13, "color": 0xFF0000FF, "font_weight": "bold"},
+            "RF ATTENUATION": {"font_size": 13, "color": 0xFF00FFFF, "font_weight": "bold"},
+            "SECURE + LOCKED": {"font_size": 13, "color": 0xFFFF00FF, "font_weight": "bold"},
+            "SECURE ZONE": {"font_size": 13, "color": 0xFF00AAFF, "font_weight": "bold"},
+            "CLEAR": {"font_size": 13, "color": 0xFF00FF00, "font_weight": "bold"},
+        }
         
         # ==================== STATE ====================
         self._waypoint_data = []
+        self._wp_poses = None  # (N, 6) float64 waypoint poses: translation, then Euler rotation in aircraft axis order
+        self._pose_buf = np.zeros(6, dtype=np.float64)  # Reused interpolation output
         self._current_progress = 0.0
         self._waypoint_nav_window = None
         self._waypoint_progress_slider = None
+        self._throttled_set_progress = None  # Slider drags coalesced to one set_progress per 75 ms
+        self._throttled_label_update = None
+        self._tick_sub = None  # Single update-stream subscription driving the RF and control tower phases
         self._rf_enabled = False
-        self._rf_subscription = None
-        self._debug_draw = None
+        self._tower_enabled = False
+        self._draw_line = None  # Bound debug-draw draw_line, acquired when RF is enabled
         self._frame_count = 0
-        self._towers = []
+        self._rf_accum = 0.0
+        self._rf_rays = {}  # antenna path -> (selected tower xyz as a float tuple, is_blocked)
+        self._rf_cutoff_sq = (self.DISTANCE_MED * 1.5) ** 2  # Squared far range beyond which extra raycasts are skipped
+        self._ramp_inv = 1.0 / (self.DISTANCE_MED * 1.5 - self.DISTANCE_NEAR)
+        self._ramp_span = self.RAY_WIDTH_MAX - self.RAY_WIDTH_MIN
+        self._towers = ()
+        self._tower_positions = None  # Cached [(path, world_pos, (x, y, z))], cleared by USD change notices
+        self._tower_xyz = None  # (M, 3) float64 copy of the cached tower positions
+        self._stage = None
+        self._stage_listener = None
+        self._prim_cache = {}  # path -> Usd.Prim on the bound stage
+        self._xformable_cache = {}  # path -> UsdGeom.Xformable on the bound stage
+        self._aircraft_xform_ops = None  # (translate, rotateXYZ) XformOps of the aircraft on the bound stage
+        self._aircraft_op_order = Sdf.Path(self.AIRCRAFT_PATH).AppendProperty("xformOpOrder")
+        self._attr_cache = {}  # antenna name -> {attr name: Usd.Attribute or None}
+        self._xform_cache = UsdGeom.XformCache(Usd.TimeCode.Default())  # Cleared once per update
         self._physx_scene_query = None
+        self._raycast = None  # Bound raycast_any (or no-hit fallback), installed when RF is enabled
         self._raycast_stats = {"blocked": 0, "clear": 0}
         self._camera_buttons = []
         self._active_camera = 0
-        self._ui_elements = {}
+        self._ui_names = ()  # Row order of the parallel UI lists below
+        self._ui_state_labels = []
+        self._ui_locked_labels = []
+        self._ui_zone_labels = []
+        self._ui_pos_labels = []
+        self._last_state = []  # Per row: last values written to its widgets (None forces a write)
+        self._last_locked = []
+        self._last_zone = []
+        self._last_pos = []
+        self._status_provider = None  # One texture holding every row's status disk
+        self._status_pixels = None  # (rows * _ROW_HEIGHT, _STATUS_DOT, 4) uint8 RGBA backing the provider
         self._control_tower_window = None
-        self._control_tower_subscription = None
+        self._tower_built = False  # Widget tree exists; start_control_tower only re-shows it
+        self._tower_scroll = None  # ScrollingFrame around the dashboard
         self._update_frame_count = 0
+        self._tower_min_dt = 1.0 / self.TOWER_UPDATE_HZ
+        self._tower_last_t = 0.0  # perf_counter time of the last tower update
+        self._bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), ["default", "render", "proxy", "guide"], useExtentsHint=True)
+        self._volume_boxes = None  # Cached {key: Gf.Range3d}, cleared by USD change notices
         self._tower_layer_muted = True  # Track tower layer muted state
         self.TOWER_LAYER_PATH = '/home/pouria/aimodels/Projects/AircraftOperationsCenter/towers_loc_B.usd'
         
         # ==================== INITIALIZATION ====================
+        stream = omni.kit.app.get_app().get_update_event_stream()
+        self._tick_sub = stream.create_subscription_to_pop(
+            self._master_tick,
+            name="airport_master_tick"
+        )
+        
         if self.verify_scene():
             self.set_progress(0.0)
             self.create_waypoint_ui()
@@ -140,69 +383,39 @@ class Airport_Extension(omni.ext.IExt):
                 return False
             
             xformable = UsdGeom.Xformable(prim)
-            translation = Gf.Vec3d(0, 0, 0)
-            rotation_euler = Gf.Vec3f(0, 0, 0)
+            pose = {
+                'path': wp_path,
+                'translation': Gf.Vec3d(0, 0, 0),
+                'rotation_euler': Gf.Vec3f(0, 0, 0)
+            }
             
             for xform_op in xformable.GetOrderedXformOps():
-                op_type = xform_op.GetOpType()
-                if op_type == UsdGeom.XformOp.TypeTranslate:
-                    translation = xform_op.Get()
-                elif op_type == UsdGeom.XformOp.TypeRotateXYZ:
-                    rotation_euler = xform_op.Get()
-                elif op_type == UsdGeom.XformOp.TypeRotateX:
-                    rotation_euler[0] = xform_op.Get()
-                elif op_type == UsdGeom.XformOp.TypeRotateY:
-                    rotation_euler[1] = xform_op.Get()
-                elif op_type == UsdGeom.XformOp.TypeRotateZ:
-                    rotation_euler[2] = xform_op.Get()
+                handler = _OP_HANDLERS.get(xform_op.GetOpType())
+                if handler:
+                    handler(xform_op, pose)
             
-            if translation == Gf.Vec3d(0, 0, 0):
+            if pose['translation'] == Gf.Vec3d(0, 0, 0):
                 local_transform = xformable.ComputeLocalToWorldTransform(Usd.TimeCode.Default())
-                translation = local_transform.ExtractTranslation()
+                pose['translation'] = local_transform.ExtractTranslation()
             
-            self._waypoint_data.append({
-                'path': wp_path,
-                'translation': translation,
-                'rotation_euler': rotation_euler
-            })
+            self._waypoint_data.append(pose)
+        
+        wp_trans = np.array([wp['translation'] for wp in self._waypoint_data], dtype=np.float64).reshape(-1, 3)
+        wp_rot = np.array([wp['rotation_euler'] for wp in self._waypoint_data], dtype=np.float32).reshape(-1, 3)[:, self._axis_idx]
+        self._wp_poses = np.ascontiguousarray(np.hstack((wp_trans, wp_rot)), dtype=np.float64)
         
         print(f"[Waypoint] ✓ Loaded {len(self._waypoint_data)} waypoints")
+        
+        self._bind_stage(stage)
+        for ant_name in self.ANTENNA_NAMES:
+            self._antenna_attrs(ant_name)
+        
         return True
     
     def interpolate_transform(self, progress):
         """Interpolate between waypoints based on progress (0.0 to 1.0)."""
-        progress = max(0.0, min(1.0, progress))
-        num_segments = len(self._waypoint_data) - 1
-        segment_size = 1.0 / num_segments
-        segment_index = int(progress / segment_size)
-        if segment_index >= num_segments:
-            segment_index = num_segments - 1
-        
-        local_blend = (progress - segment_index * segment_size) / segment_size
-        local_blend = max(0.0, min(1.0, local_blend))
-        
-        wp_start = self._waypoint_data[segment_index]
-        wp_end = self._waypoint_data[segment_index + 1]
-        
-        trans_start = wp_start['translation']
-        trans_end = wp_end['translation']
-        interp_translation = trans_start * (1.0 - local_blend) + trans_end * local_blend
-        
-        rot_start = wp_start['rotation_euler']
-        rot_end = wp_end['rotation_euler']
-        interp_rotation_waypoint = Gf.Vec3f(
-            rot_start[0] * (1.0 - local_blend) + rot_end[0] * local_blend,
-            rot_start[1] * (1.0 - local_blend) + rot_end[1] * local_blend,
-            rot_start[2] * (1.0 - local_blend) + rot_end[2] * local_blend
-        )
-        
-        interp_rotation = Gf.Vec3f(
-            interp_rotation_waypoint[self.AXIS_MAP[0]],
-            interp_rotation_waypoint[self.AXIS_MAP[1]],
-            interp_rotation_waypoint[self.AXIS_MAP[2]]
-        )
-        
-        return interp_translation, interp_rotation
+        pose = _interp_waypoint(progress, self._wp_poses, self._pose_buf)
+        return Gf.Vec3d(pose[0], pose[1], pose[2]), Gf.Vec3f(pose[3], pose[4], pose[5])
     
     def update_aircraft_transform(self, progress):
         """Update aircraft transform based on progress."""
@@ -210,27 +423,13 @@ class Airport_Extension(omni.ext.IExt):
         if not stage:
             return False
         
-        aircraft_prim = stage.GetPrimAtPath(self.AIRCRAFT_PATH)
+        self._bind_stage(stage)
+        aircraft_prim = self._prim(self.AIRCRAFT_PATH)
         if not aircraft_prim or not aircraft_prim.IsValid():
             return False
         
         translation, rotation_euler = self.interpolate_transform(progress)
-        xformable = UsdGeom.Xformable(aircraft_prim)
-        
-        translate_op = None
-        rotate_op = None
-        
-        for xform_op in xformable.GetOrderedXformOps():
-            op_type = xform_op.GetOpType()
-            if op_type == UsdGeom.XformOp.TypeTranslate:
-                translate_op = xform_op
-            elif op_type == UsdGeom.XformOp.TypeRotateXYZ:
-                rotate_op = xform_op
-        
-        if not translate_op:
-            translate_op = xformable.AddTranslateOp()
-        if not rotate_op:
-            rotate_op = xformable.AddRotateXYZOp()
+        translate_op, rotate_op = self._aircraft_ops()
         
         translate_op.Set(translation)
         rotate_op.Set(rotation_euler)
@@ -246,6 +445,130 @@ class Airport_Extension(omni.ext.IExt):
             return True
         return False
     
+    # ==================== STAGE CACHE FUNCTIONS ====================
+    
+    def _bind_stage(self, stage):
+        """Register for change notices on the current stage and drop caches when it changes."""
+        if self._stage_listener and self._stage == stage:
+            return
+        
+        if self._stage_listener:
+            self._stage_listener.Revoke()
+        
+        self._stage = stage
+        self._stage_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+        self._prim_cache.clear()
+        self._xformable_cache.clear()
+        self._aircraft_xform_ops = None
+        self._attr_cache.clear()
+        self._tower_positions = None
+        self._volume_boxes = None
+        
+        if self._rf_enabled:
+            self.acquire_debug_draw()
+    
+    def _prim(self, path):
+        """Get the prim at path on the bound stage, memoized until it is resynced."""
+        prim = self._prim_cache.get(path)
+        if prim is None:
+            prim = self._stage.GetPrimAtPath(path)
+            self._prim_cache[path] = prim
+        return prim
+    
+    def _xformable(self, path):
+        """Get a memoized UsdGeom.Xformable wrapper for the prim at path."""
+        xformable = self._xformable_cache.get(path)
+        if xformable is None:
+            xformable = UsdGeom.Xformable(self._prim(path))
+            self._xformable_cache[path] = xformable
+        return xformable
+    
+    def _aircraft_ops(self):
+        """Get the memoized (translate, rotateXYZ) ops of the aircraft, adding any that are missing."""
+        if self._aircraft_xform_ops is None:
+            xformable = self._xformable(self.AIRCRAFT_PATH)
+            ops = {}
+            for xform_op in xformable.GetOrderedXformOps():
+                slot = _AIRCRAFT_OP_SLOTS.get(xform_op.GetOpType())
+                if slot:
+                    ops[slot] = xform_op
+            translate_op = ops.get("translate") or xformable.AddTranslateOp()
+            rotate_op = ops.get("rotate") or xformable.AddRotateXYZOp()
+            self._aircraft_xform_ops = (translate_op, rotate_op)
+        return self._aircraft_xform_ops
+    
+    def _antenna_attrs(self, ant_name):
+        """Get memoized attribute handles of an antenna (None for missing attributes)."""
+        attrs = self._attr_cache.get(ant_name)
+        if attrs is None:
+            ant_prim = self._prim(f"{self.ANTENNA_ROOT}/{ant_name}")
+            if not ant_prim or not ant_prim.IsValid():
+                return None
+            
+            attrs = {}
+            for attr_name in self.ANTENNA_ATTRS:
+                attr = ant_prim.GetAttribute(attr_name)
+                attrs[attr_name] = attr if attr.IsValid() else None
+            self._attr_cache[ant_name] = attrs
+        return attrs
+    
+    def _paths_touch(self, paths, root):
+        """Check if any changed path affects the subtree at root (ancestors included)."""
+        for path in paths:
+            prim_path = path.GetPrimPath()
+            if prim_path.HasPrefix(root) or root.HasPrefix(prim_path):
+                return True
+        return False
+    
+    def _drop_cached_prims(self, resynced_paths):
+        """Forget memoized prim handles at or below any resynced path."""
+        for path in resynced_paths:
+            prefix = path.GetPrimPath()
+            for key in [key for key in self._prim_cache if Sdf.Path(key).HasPrefix(prefix)]:
+                self._prim_cache.pop(key, None)
+                self._xformable_cache.pop(key, None)
+            for ant_name in [name for name in self._attr_cache if Sdf.Path(f"{self.ANTENNA_ROOT}/{name}").HasPrefix(prefix)]:
+                self._attr_cache.pop(ant_name, None)
+    
+    def _on_objects_changed(self, notice, sender):
+        """Invalidate cached scene data touched by a USD edit."""
+        resynced_paths = notice.GetResyncedPaths()
+        if (self._prim_cache or self._attr_cache) and resynced_paths:
+            self._drop_cached_prims(resynced_paths)
+        
+        # Op values are written every slider move; only a resync or a new op order invalidates the ops
+        if self._aircraft_xform_ops is not None:
+            if self._paths_touch(resynced_paths, Sdf.Path(self.AIRCRAFT_PATH)) or self._aircraft_op_order in notice.GetChangedInfoOnlyPaths():
+                self._aircraft_xform_ops = None
+        
+        if self._tower_positions is None and self._volume_boxes is None:
+            return
+        
+        changed_paths = resynced_paths + notice.GetChangedInfoOnlyPaths()
+        
+        if self._tower_positions is not None:
+            if self._paths_touch(changed_paths, Sdf.Path(self.TOWERS_ROOT)):
+                self._tower_positions = None
+        
+        if self._volume_boxes is not None:
+            for volume_path in self.VOLUMES.values():
+                if self._paths_touch(changed_paths, Sdf.Path(volume_path)):
+                    self._volume_boxes = None
+                    break
+    
+    def _unbind_stage(self):
+        """Revoke the stage change listener."""
+        if self._stage_listener:
+            self._stage_listener.Revoke()
+            self._stage_listener = None
+        self._stage = None
+        self._prim_cache.clear()
+        self._xformable_cache.clear()
+        self._aircraft_xform_ops = None
+        self._attr_cache.clear()
+        self._tower_positions = None
+        self._volume_boxes = None
+    
     # ==================== RF VISUALIZATION FUNCTIONS ====================
     
     def get_all_towers(self):
@@ -254,43 +577,44 @@ class Airport_Extension(omni.ext.IExt):
         if not stage:
             return []
         
-        towers_parent = stage.GetPrimAtPath("/World/Towers")
+        towers_parent = stage.GetPrimAtPath(self.TOWERS_ROOT)
         if not towers_parent or not towers_parent.IsValid():
             return []
         
+        # Walk only the direct children, in C++, instead of materializing GetChildren()
         tower_paths = []
-        for child in towers_parent.GetChildren():
+        prim_range = iter(Usd.PrimRange(towers_parent, Usd.TraverseInstanceProxies(Usd.PrimDefaultPredicate)))
+        next(prim_range)  # Skip /World/Towers itself
+        for child in prim_range:
+            prim_range.PruneChildren()
             if child.GetName().startswith("Tower_"):
                 tower_paths.append(child.GetPath().pathString)
         
-        return sorted(tower_paths)
+        return tuple(sorted(tower_paths))
     
-    def get_world_position(self, prim_path, stage):
-        """Get world-space position of a prim."""
-        prim = stage.GetPrimAtPath(prim_path)
+    def get_world_position(self, prim_path):
+        """Get world-space position of a prim on the bound stage."""
+        prim = self._prim(prim_path)
         if not prim or not prim.IsValid():
             return None
         
-        xformable = UsdGeom.Xformable(prim)
-        world_transform = xformable.ComputeLocalToWorldTransform(Usd.TimeCode.Default())
+        world_transform = self._xform_cache.GetLocalToWorldTransform(prim)
         return world_transform.ExtractTranslation()
     
-    def compute_distance(self, pos1, pos2):
-        """Compute Euclidean distance between two points."""
-        diff = pos1 - pos2
-        return math.sqrt(diff[0]**2 + diff[1]**2 + diff[2]**2)
+    def get_tower_positions(self):
+        """Get world positions of all towers, cached until a tower changes."""
+        if self._tower_positions is None:
+            self._tower_positions = []
+            for tower_path in self._towers:
+                tower_pos = self.get_world_position(tower_path)
+                if tower_pos:
+                    tower_tuple = (float(tower_pos[0]), float(tower_pos[1]), float(tower_pos[2]))
+                    self._tower_positions.append((tower_path, tower_pos, tower_tuple))
+            self._tower_xyz = np.array([xyz for _, _, xyz in self._tower_positions], dtype=np.float64).reshape(-1, 3)
+        return self._tower_positions
     
     def check_line_of_sight(self, start_pos, end_pos):
         """Check if there's a clear line of sight using physics raycast."""
-        if not self._physx_scene_query:
-            try:
-                self._physx_scene_query = omni.physx.get_physx_scene_query_interface()
-            except:
-                return (True, None, None)
-        
-        if not self._physx_scene_query:
-            return (True, None, None)
-        
         origin = (float(start_pos[0]), float(start_pos[1]), float(start_pos[2]))
         direction_vec = end_pos - start_pos
         distance = math.sqrt(direction_vec[0]**2 + direction_vec[1]**2 + direction_vec[2]**2)
@@ -302,18 +626,10 @@ class Airport_Extension(omni.ext.IExt):
                 float(direction_vec[2] / distance)
             )
         else:
-            return (True, None, None)
+            return True
         
-        try:
-            hit = self._physx_scene_query.raycast_closest(origin, direction, distance)
-            if hit and hit["hit"]:
-                hit_distance = hit.get("distance", 0)
-                hit_prim_path = hit.get("rigidBody", "Unknown")
-                return (False, hit_distance, hit_prim_path)
-            else:
-                return (True, None, None)
-        except:
-            return (True, None, None)
+        # Any hit blocks the signal, so the allocation-free boolean query is enough
+        return not self._raycast(origin, direction, distance)
     
     def get_color_from_distance(self, distance):
         """Get color based on distance."""
@@ -334,21 +650,44 @@ class Airport_Extension(omni.ext.IExt):
             return "OFF"
     
     def get_thickness_from_distance(self, distance):
-        """Get ray thickness based on distance."""
-        if distance <= self.DISTANCE_NEAR:
-            return self.RAY_WIDTH_MAX
-        elif distance >= self.DISTANCE_MED * 1.5:
-            return self.RAY_WIDTH_MIN
-        else:
-            t = (distance - self.DISTANCE_NEAR) / ((self.DISTANCE_MED * 1.5) - self.DISTANCE_NEAR)
-            t = max(0.0, min(1.0, t))
-            return self.RAY_WIDTH_MAX - (self.RAY_WIDTH_MAX - self.RAY_WIDTH_MIN) * t
+        """Get ray thickness based on distance (clamped linear ramp from near to far range)."""
+        t = max(0.0, min(1.0, (distance - self.DISTANCE_NEAR) * self._ramp_inv))
+        return self.RAY_WIDTH_MAX - self._ramp_span * t
+    
+    def acquire_debug_draw(self):
+        """Bind the debug-draw line call once; falls back to a no-op if unavailable."""
+        try:
+            self._draw_line = get_debug_draw_interface().draw_line
+        except Exception as e:
+            print(f"[RF] Debug draw unavailable: {e}")
+            self._draw_line = lambda *args: None
     
-    def draw_signal_ray(self, tower_pos, end_pos, distance, is_blocked=False):
-        """Draw a visual ray from tower to antenna."""
-        if not self._debug_draw:
-            self._debug_draw = get_debug_draw_interface()
+    def acquire_raycast(self):
+        """Bind raycast_any once; the first query swaps in the raw call or a no-hit fallback."""
+        try:
+            self._physx_scene_query = omni.physx.get_physx_scene_query_interface()
+            raycast = self._physx_scene_query.raycast_any
+        except Exception as e:
+            print(f"[RF] PhysX scene query unavailable: {e}")
+            self._physx_scene_query = None
+            self._raycast = lambda *args: False
+            return False
+        
+        def probe(origin, direction, distance):
+            try:
+                hit = raycast(origin, direction, distance)
+            except Exception as e:
+                print(f"[RF] Raycast failed, collision detection disabled: {e}")
+                self._raycast = lambda *args: False
+                return False
+            self._raycast = raycast
+            return hit
         
+        self._raycast = probe
+        return True
+    
+    def draw_signal_ray(self, tower_pos_tuple, end_pos_tuple, distance, is_blocked=False):
+        """Draw a visual ray from tower to antenna (endpoints as float tuples)."""
         if is_blocked:
             color = self.COLOR_BLOCKED
             thickness = self.RAY_WIDTH_MIN
@@ -356,102 +695,102 @@ class Airport_Extension(omni.ext.IExt):
             color = self.get_color_from_distance(distance)
             thickness = self.get_thickness_from_distance(distance)
         
-        try:
-            self._debug_draw.draw_line(
-                tuple(tower_pos),
-                color,
-                thickness,
-                tuple(end_pos),
-                color,
-                thickness
-            )
-        except:
-            pass
+        self._draw_line(tower_pos_tuple, color, thickness, end_pos_tuple, color, thickness)
     
-    def update_rf_signals(self, dt):
-        """Per-frame update for RF visualization with collision detection."""
-        if not self._rf_enabled:
-            return
-        
-        stage = omni.usd.get_context().get_stage()
-        if not stage:
-            return
-        
+    def draw_cached_rays(self):
+        """Redraw the last selected rays, ending each at its antenna's current position."""
+        for antenna_path, (tower_xyz, is_blocked) in self._rf_rays.items():
+            antenna_pos = self.get_world_position(antenna_path)
+            if not antenna_pos:
+                continue
+            antenna_xyz = (float(antenna_pos[0]), float(antenna_pos[1]), float(antenna_pos[2]))
+            dx = antenna_xyz[0] - tower_xyz[0]
+            dy = antenna_xyz[1] - tower_xyz[1]
+            dz = antenna_xyz[2] - tower_xyz[2]
+            distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+            self.draw_signal_ray(tower_xyz, antenna_xyz, distance, is_blocked=is_blocked)
+    
+    def _rf_phase(self, dt):
+        """Per-frame RF visualization phase with collision detection."""
         self._frame_count += 1
         
         if self._frame_count % 60 == 0:
-            self._debug_draw = get_debug_draw_interface()
             self._raycast_stats = {"blocked": 0, "clear": 0}
         
+        # Tower selection and raycasts run at RF_UPDATE_HZ; the rays follow the antennas every frame
+        self._rf_accum += dt
+        if self._rf_accum < 1.0 / self.RF_UPDATE_HZ:
+            self.draw_cached_rays()
+            return
+        self._rf_accum = 0.0
+        
+        frame_tower_positions = self.get_tower_positions()
+        
         for antenna_path in self.ANTENNAS_VIS:
-            antenna_pos = self.get_world_position(antenna_path, stage)
+            antenna_pos = self.get_world_position(antenna_path)
             if not antenna_pos:
                 continue
+            antenna_xyz = (float(antenna_pos[0]), float(antenna_pos[1]), float(antenna_pos[2]))
             
-            closest_tower = None
-            closest_distance = float('inf')
-            closest_tower_pos = None
+            closest_tower_xyz = None
             is_signal_blocked = False
-            blocking_obstacle = None
             
-            for tower_path in self._towers:
-                tower_pos = self.get_world_position(tower_path, stage)
-                if not tower_pos:
-                    continue
+            # Nearest first: the first clear tower is the closest clear one, so stop raycasting there
+            order, distances_sq = _rf_select(self._tower_xyz, np.array(antenna_xyz, dtype=np.float64))
+            
+            for idx in order:
+                _, tower_pos, tower_xyz = frame_tower_positions[idx]
+                distance_sq = float(distances_sq[idx])
+                
+                # Past the far range a tower can only draw as a weak red ray, so a blocked fallback is enough
+                if closest_tower_xyz is not None and distance_sq > self._rf_cutoff_sq:
+                    break
                 
-                distance = self.compute_distance(tower_pos, antenna_pos)
-                is_clear, hit_distance, hit_prim = self.check_line_of_sight(tower_pos, antenna_pos)
+                is_clear = self.check_line_of_sight(tower_pos, antenna_pos)
                 
                 if is_clear:
-                    if distance < closest_distance:
-                        closest_distance = distance
-                        closest_tower = tower_path
-                        closest_tower_pos = tower_pos
-                        is_signal_blocked = False
-                        blocking_obstacle = None
-                else:
-                    if closest_distance == float('inf'):
-                        if distance < closest_distance or closest_distance == float('inf'):
-                            closest_distance = distance
-                            closest_tower = tower_path
-                            closest_tower_pos = tower_pos
-                            is_signal_blocked = True
-                            blocking_obstacle = hit_prim
+                    closest_tower_xyz = tower_xyz
+                    is_signal_blocked = False
+                    break
+                
+                # Fallback if all are blocked: keep the nearest blocked tower
+                if closest_tower_xyz is None:
+                    closest_tower_xyz = tower_xyz
+                    is_signal_blocked = True
             
-            if closest_tower_pos:
+            if closest_tower_xyz is not None:
                 if is_signal_blocked:
                     self._raycast_stats["blocked"] += 1
                 else:
                     self._raycast_stats["clear"] += 1
                 
-                self.draw_signal_ray(closest_tower_pos, antenna_pos, closest_distance, is_blocked=is_signal_blocked)
+                self._rf_rays[antenna_path] = (closest_tower_xyz, is_signal_blocked)
+            else:
+                self._rf_rays.pop(antenna_path, None)
+        
+        self.draw_cached_rays()
     
     def toggle_rf_visualization(self, enabled):
         """Enable or disable RF visualization."""
         self._rf_enabled = enabled
+        self._rf_rays = {}
+        self._rf_accum = 1.0 / self.RF_UPDATE_HZ  # Select towers on the first tick after enabling
         
         if enabled:
             self._towers = self.get_all_towers()
+            self._tower_positions = None
+            self.acquire_debug_draw()
             
             if not self._towers:
                 print("[RF] No towers found!")
                 self._rf_enabled = False
                 return
             
-            try:
-                self._physx_scene_query = omni.physx.get_physx_scene_query_interface()
+            if self.acquire_raycast():
                 physx_status = "✓ Physics ENABLED (collision detection active)"
-            except:
-                self._physx_scene_query = None
+            else:
                 physx_status = "⚠ Physics UNAVAILABLE (no collision detection)"
             
-            if not self._rf_subscription:
-                stream = omni.kit.app.get_app().get_update_event_stream()
-                self._rf_subscription = stream.create_subscription_to_pop(
-                    self.update_rf_signals,
-                    name="rf_visualization_update"
-                )
-            
             print(f"[RF] Visualization ENABLED ({len(self._towers)} towers)")
             print(f"[RF] {physx_status}")
         else:
@@ -507,87 +846,92 @@ class Airport_Extension(omni.ext.IExt):
     
     # ==================== CONTROL TOWER FUNCTIONS ====================
     
-    def is_inside_volume(self, ant_pos, volume_prim, stage):
-        """Check if antenna position is inside a volume's bounding box."""
-        if not volume_prim or not volume_prim.IsValid():
+    def get_volume_boxes(self):
+        """Get world-space aligned boxes of all RF volumes, cached until a volume changes."""
+        if self._volume_boxes is None:
+            self._bbox_cache.Clear()
+            self._volume_boxes = {}
+            for key, volume_path in self.VOLUMES.items():
+                volume_prim = self._prim(volume_path)
+                if not volume_prim or not volume_prim.IsValid():
+                    self._volume_boxes[key] = None
+                    continue
+                
+                volume_bbox = self._bbox_cache.ComputeWorldBound(volume_prim)
+                self._volume_boxes[key] = volume_bbox.ComputeAlignedBox()
+        return self._volume_boxes
+    
+    def is_inside_volume(self, ant_pos, volume_box):
+        """Check if antenna position is inside a volume's aligned bounding box."""
+        if volume_box is None:
             return False
         
-        bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), ["default", "render", "proxy", "guide"])
-        volume_bbox = bbox_cache.ComputeWorldBound(volume_prim)
-        aligned_box = volume_bbox.ComputeAlignedBox()
-        
-        return aligned_box.Contains(ant_pos)
+        return volume_box.Contains(ant_pos)
     
-    def update_antenna_states(self, stage):
+    def update_antenna_states(self):
         """Update signal_state for all antennas based on volume logic."""
-        if not stage:
-            return
-        
-        block_vol = stage.GetPrimAtPath(self.VOLUMES["block"])
-        atten_vol = stage.GetPrimAtPath(self.VOLUMES["atten"])
-        secure_vol = stage.GetPrimAtPath(self.VOLUMES["secure"])
+        volume_boxes = self.get_volume_boxes()
+        block_box = volume_boxes["block"]
+        atten_box = volume_boxes["atten"]
+        secure_box = volume_boxes["secure"]
         
         states_changed = []
         
-        for ant_name in self.ANTENNA_NAMES:
-            ant_path = f"{self.ANTENNA_ROOT}/{ant_name}"
-            ant_prim = stage.GetPrimAtPath(ant_path)
+        for ant_name, ant_path in zip(self.ANTENNA_NAMES, self._ant_paths):
+            ant_prim = self._prim(ant_path)
             
             if not ant_prim or not ant_prim.IsValid():
                 continue
             
-            xformable = UsdGeom.Xformable(ant_prim)
-            world_transform = xformable.ComputeLocalToWorldTransform(Usd.TimeCode.Default())
+            world_transform = self._xform_cache.GetLocalToWorldTransform(ant_prim)
             ant_pos = world_transform.ExtractTranslation()
             
+            attrs = self._antenna_attrs(ant_name)
             policy_locked = False
-            if ant_prim.HasAttribute("policy_locked"):
-                policy_locked = ant_prim.GetAttribute("policy_locked").Get() or False
+            if attrs["policy_locked"]:
+                policy_locked = attrs["policy_locked"].Get() or False
             
             new_state = "ON"
-            if self.is_inside_volume(ant_pos, block_vol, stage):
+            if self.is_inside_volume(ant_pos, block_box):
                 new_state = "OFF"
-            elif self.is_inside_volume(ant_pos, atten_vol, stage):
+            elif self.is_inside_volume(ant_pos, atten_box):
                 new_state = "DEGRADED"
-            elif self.is_inside_volume(ant_pos, secure_vol, stage) and policy_locked:
+            elif self.is_inside_volume(ant_pos, secure_box) and policy_locked:
                 new_state = "OFF"
             
-            old_state = None
-            if ant_prim.HasAttribute("signal_state"):
-                old_state = ant_prim.GetAttribute("signal_state").Get()
-                ant_prim.GetAttribute("signal_state").Set(new_state)
-                
+            state_attr = attrs["signal_state"]
+            if state_attr:
+                old_state = state_attr.Get()
+                # Only real transitions are written; every Set emits a USD change notice
                 if old_state != new_state:
+                    state_attr.Set(new_state)
                     states_changed.append(f"{ant_name}: {old_state}→{new_state}")
         
         if states_changed:
             print(f"[Control Tower] State changes: {', '.join(states_changed)}")
     
-    def get_antenna_data(self, stage, ant_name):
-        """Get all antenna data for dashboard display."""
-        ant_path = f"{self.ANTENNA_ROOT}/{ant_name}"
-        ant_prim = stage.GetPrimAtPath(ant_path)
+    def get_antenna_data(self, idx):
+        """Get all antenna data for dashboard display (idx into ANTENNA_NAMES); pos is the raw world position."""
+        ant_name = self.ANTENNA_NAMES[idx]
+        ant_prim = self._prim(self._ant_paths[idx])
         
         if not ant_prim or not ant_prim.IsValid():
             return None
         
-        xformable = UsdGeom.Xformable(ant_prim)
-        world_transform = xformable.ComputeLocalToWorldTransform(Usd.TimeCode.Default())
+        world_transform = self._xform_cache.GetLocalToWorldTransform(ant_prim)
         pos = world_transform.ExtractTranslation()
         
-        signal_state = ant_prim.GetAttribute("signal_state").Get() if ant_prim.HasAttribute("signal_state") else "UNKNOWN"
-        policy_locked = ant_prim.GetAttribute("policy_locked").Get() if ant_prim.HasAttribute("policy_locked") else False
-        freq_band = ant_prim.GetAttribute("frequency_band").Get() if ant_prim.HasAttribute("frequency_band") else "N/A"
-        requires_los = ant_prim.GetAttribute("requires_LOS").Get() if ant_prim.HasAttribute("requires_LOS") else False
-        ant_type = ant_prim.GetAttribute("antenna:type").Get() if ant_prim.HasAttribute("antenna:type") else "UNKNOWN"
-        
-        block_vol = stage.GetPrimAtPath(self.VOLUMES["block"])
-        atten_vol = stage.GetPrimAtPath(self.VOLUMES["atten"])
-        secure_vol = stage.GetPrimAtPath(self.VOLUMES["secure"])
+        attrs = self._antenna_attrs(ant_name)
+        signal_state = attrs["signal_state"].Get() if attrs["signal_state"] else "UNKNOWN"
+        policy_locked = attrs["policy_locked"].Get() if attrs["policy_locked"] else False
+        freq_band = attrs["frequency_band"].Get() if attrs["frequency_band"] else "N/A"
+        requires_los = attrs["requires_LOS"].Get() if attrs["requires_LOS"] else False
+        ant_type = attrs["antenna:type"].Get() if attrs["antenna:type"] else "UNKNOWN"
         
-        in_block = self.is_inside_volume(pos, block_vol, stage)
-        in_atten = self.is_inside_volume(pos, atten_vol, stage)
-        in_secure = self.is_inside_volume(pos, secure_vol, stage)
+        volume_boxes = self.get_volume_boxes()
+        in_block = self.is_inside_volume(pos, volume_boxes["block"])
+        in_atten = self.is_inside_volume(pos, volume_boxes["atten"])
+        in_secure = self.is_inside_volume(pos, volume_boxes["secure"])
         
         zone = "CLEAR"
         if in_block:
@@ -607,64 +951,131 @@ class Airport_Extension(omni.ext.IExt):
             "los": "YES" if requires_los else "NO",
             "locked": "YES" if policy_locked else "NO",
             "zone": zone,
-            "pos": f"({pos[0]:.0f}, {pos[1]:.0f}, {pos[2]:.0f})"
+            "pos": pos
         }
     
     def update_tower_ui_data(self):
         """Update only the data in existing UI elements."""
-        stage = omni.usd.get_context().get_stage()
-        if not stage or not self._ui_elements:
+        if not self._ui_names:
             return
         
-        for ant_name in self.ANTENNA_NAMES:
-            data = self.get_antenna_data(stage, ant_name)
-            if not data or ant_name not in self._ui_elements:
+        status_dirty = False
+        pos_rows = []
+        positions = []
+        for i in self._visible_rows():
+            data = self.get_antenna_data(i)
+            if not data:
                 continue
             
-            elements = self._ui_elements[ant_name]
-            state_color = self.STATE_COLORS.get(data["state"], self.STATE_COLORS["UNKNOWN"])
-            locked_color = 0xFF0000FF if data["locked"] == "YES" else 0xFF00FF00
+            # Only touch widgets whose value changed; text and style writes trigger a redraw
+            state = data["state"]
+            if state != self._last_state[i]:
+                self.paint_status_dot(i, state)
+                status_dirty = True
+                self._ui_state_labels[i].text = state
+                self._last_state[i] = state
             
-            zone_color = 0xFFFFFFFF
-            if data["zone"] == "RF BLOCKING":
-                zone_color = 0xFF0000FF
-            elif data["zone"] == "RF ATTENUATION":
-                zone_color = 0xFF00FFFF
-            elif data["zone"] == "SECURE + LOCKED":
-                zone_color = 0xFFFF00FF
-            elif data["zone"] == "SECURE ZONE":
-                zone_color = 0xFF00AAFF
-            else:
-                zone_color = 0xFF00FF00
+            locked = data["locked"]
+            if locked != self._last_locked[i]:
+                self._ui_locked_labels[i].text = locked
+                self._ui_locked_labels[i].style = self._locked_styles[locked]
+                self._last_locked[i] = locked
+            
+            zone = data["zone"]
+            if zone != self._last_zone[i]:
+                self._ui_zone_labels[i].text = zone
+                self._ui_zone_labels[i].style = self._zone_styles[zone]
+                self._last_zone[i] = zone
             
-            elements["circle"].style = {"background_color": state_color}
-            elements["state_label"].text = data["state"]
-            elements["locked_label"].text = data["locked"]
-            elements["locked_label"].style = {"font_size": 14, "color": locked_color, "font_weight": "bold"}
-            elements["zone_label"].text = data["zone"]
-            elements["zone_label"].style = {"font_size": 13, "color": zone_color, "font_weight": "bold"}
-            elements["pos_label"].text = data["pos"]
-    
-    def tower_master_update(self, dt):
-        """Per-frame update for control tower."""
+            pos_rows.append(i)
+            positions.append(data["pos"])
+        
+        # Round every position in one NumPy pass; only rows whose rounded value moved get formatted
+        if pos_rows:
+            rounded = np.rint(np.array(positions, dtype=np.float64)).astype(np.int64).tolist()
+            for i, xyz in zip(pos_rows, rounded):
+                if xyz != self._last_pos[i]:
+                    self._ui_pos_labels[i].text = "({}, {}, {})".format(*xyz)
+                    self._last_pos[i] = xyz
+        
+        # All status disks share one texture: a single upload per frame that changed any of them
+        if status_dirty:
+            height, width = self._status_pixels.shape[:2]
+            self._status_provider.set_data_array(self._status_pixels, [width, height])
+    
+    def _visible_rows(self):
+        """Rows currently inside the dashboard's scrolled viewport."""
+        rows = len(self._ui_names)
+        if not self._tower_scroll:
+            return range(rows)
+        top = self._tower_scroll.scroll_y - _TOWER_ROWS_TOP
+        first = max(0, int(top // _ROW_HEIGHT))
+        last = min(rows, int((top + self._tower_scroll.computed_height) // _ROW_HEIGHT) + 1)
+        return range(first, last)
+    
+    def _reset_last_ui_values(self):
+        """Forget the last-written row values so the next update rewrites every widget."""
+        rows = len(self._ui_names)
+        self._last_state = [None] * rows
+        self._last_locked = [None] * rows
+        self._last_zone = [None] * rows
+        self._last_pos = [None] * rows
+    
+    def paint_status_dot(self, row, state):
+        """Copy the state's precomputed disk tile into this row's slice of the shared status texture."""
+        top = row * _ROW_HEIGHT + (_ROW_HEIGHT - _STATUS_DOT) // 2
+        self._status_pixels[top:top + _STATUS_DOT] = self._status_dots.get(state, self._status_dots["UNKNOWN"])
+    
+    def _tower_phase(self):
+        """Per-frame control tower phase; the USD reads and label writes run at most TOWER_UPDATE_HZ."""
         self._update_frame_count += 1
         
         if self._update_frame_count % 60 == 0:
             print(f"[Control Tower] Update running (frame {self._update_frame_count})")
         
+        now = time.perf_counter()
+        if now - self._tower_last_t < self._tower_min_dt:
+            return
+        self._tower_last_t = now
+        
+        self.update_antenna_states()
+        self.update_tower_ui_data()
+    
+    def _master_tick(self, e):
+        """Shared per-frame update: one stage lookup and xform cache reset for both phases."""
+        if not (self._rf_enabled or self._tower_enabled):
+            return
+        
         stage = omni.usd.get_context().get_stage()
-        if stage:
-            self.update_antenna_states(stage)
-            self.update_tower_ui_data()
+        if not stage:
+            return
+        
+        dt = e.payload["dt"]
+        self._bind_stage(stage)
+        self._xform_cache.Clear()
+        
+        if self._rf_enabled:
+            self._rf_phase(dt)
+        if self._tower_enabled:
+            self._tower_phase()
     
     # ==================== UI BUILDERS ====================
     
+    def _destroy_slider_throttles(self):
+        """Drop the slider throttles and their pending trailing calls."""
+        for throttle in (self._throttled_set_progress, self._throttled_label_update):
+            if throttle:
+                throttle.destroy()
+        self._throttled_set_progress = None
+        self._throttled_label_update = None
+    
     def create_waypoint_ui(self):
         """Create the waypoint navigation UI window."""
         if self._waypoint_nav_window:
             self._waypoint_nav_window.destroy()
             self._waypoint_nav_window = None
         
+        self._destroy_slider_throttles()
         self._camera_buttons = []
         self._active_camera = 0
         
@@ -677,7 +1088,6 @@ class Airport_Extension(omni.ext.IExt):
         
         self._waypoint_nav_window.position_x = 20
         self._waypoint_nav_window.position_y = 500
-        self._waypoint_nav_window.visible = True
         
         with self._waypoint_nav_window.frame:
             with ui.HStack():
@@ -725,10 +1135,17 @@ class Airport_Extension(omni.ext.IExt):
                             width=500
                         )
                         self._waypoint_progress_slider.model.set_value(self._current_progress)
-                        self._waypoint_progress_slider.model.add_value_changed_fn(lambda m: self.set_progress(m.get_value_as_float()))
-                        
                         progress_label = ui.Label(f"{self._current_progress:.2f}", width=50)
-                        self._waypoint_progress_slider.model.add_value_changed_fn(lambda m: setattr(progress_label, 'text', f"{m.get_value_as_float():.2f}"))
+                        self._throttled_set_progress = throttled(self.set_progress, 75)
+                        self._throttled_label_update = throttled(lambda v: setattr(progress_label, 'text', f"{v:.2f}"), 50)
+                        
+                        # One value-changed callback feeds both throttles
+                        def _on_slider(model, set_progress=self._throttled_set_progress, update_label=self._throttled_label_update):
+                            value = model.get_value_as_float()
+                            set_progress(value)
+                            update_label(value)
+                        
+                        self._waypoint_progress_slider.model.add_value_changed_fn(_on_slider)
                     
                     ui.Spacer(height=2)
                     
@@ -736,89 +1153,101 @@ class Airport_Extension(omni.ext.IExt):
                     with ui.HStack(spacing=1):
                         ui.Label("Quick Move:", width=80)
                         
-                        num_waypoints = len(self.WAYPOINT_PATHS)
-                        for i in range(1, num_waypoints + 1):
-                            progress_val = (i - 1) / (num_waypoints - 1)
-                            ui.Button(f"Loc. {i}", width=60, clicked_fn=lambda p=progress_val: self.set_progress(p))
+                        for i, progress_val in enumerate(self._WAYPOINT_PROGRESS):
+                            ui.Button(f"Loc. {i + 1}", width=60, clicked_fn=functools.partial(self.set_progress, progress_val))
                     
                     ui.Spacer(height=1)  # Bottom spacer
                 ui.Spacer(width=20)  # Right margin
     
     def start_control_tower(self):
-        """Start the control tower dashboard."""
+        """Start the control tower dashboard, building its window only on first use."""
+        if self._tower_built and self._control_tower_window:
+            self._control_tower_window.visible = True
+            self._reset_last_ui_values()  # Rewrite every row on the next update
+        else:
+            self._build_control_tower_ui()
+        
+        # Driven by the shared master tick
+        self._tower_enabled = True
+        
+        print("[Control Tower] Started - Dashboard active")
+    
+    def _build_control_tower_ui(self):
+        """Build the dashboard window and its row widgets."""
         if self._control_tower_window:
             self._control_tower_window.destroy()
             self._control_tower_window = None
         
         self._control_tower_window = ui.Window("AIRCRAFT RF CONTROL TOWER", width=1300, height=750)
-        
-        self._control_tower_window.frame.set_style({
-            "Tooltip": {
-                "background_color": 0xFF000000,
-                "color": 0xFFFFFFFF,
-                "border_radius": 4,
-                "padding": 12,
-                "font_size": 19
-            }
-        })
+        self._ui_names = tuple(self.ANTENNA_NAMES)
+        self._status_pixels = np.zeros((len(self._ui_names) * _ROW_HEIGHT, _STATUS_DOT, 4), dtype=np.uint8)
+        self._status_provider = ui.ByteImageProvider()
+        self._status_provider.set_data_array(self._status_pixels, [_STATUS_DOT, self._status_pixels.shape[0]])
+        self._ui_state_labels = []
+        self._ui_locked_labels = []
+        self._ui_zone_labels = []
+        self._ui_pos_labels = []
+        self._reset_last_ui_values()
+        
+        self._control_tower_window.frame.set_style(_TOWER_FRAME_STYLE)
         
         with self._control_tower_window.frame:
-            with ui.ScrollingFrame(
+            # Updates are culled to the rows this frame shows (see _visible_rows)
+            self._tower_scroll = ui.ScrollingFrame(
                 horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_ALWAYS_OFF,
                 vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED
-            ):
+            )
+            with self._tower_scroll:
                 with ui.ZStack():
                     ui.Rectangle(style={"background_color": 0xFF1A1A1A})
                     with ui.VStack(spacing=0):
                         # Title Header
-                        with ui.ZStack(height=60):
+                        with ui.ZStack(height=_TITLE_HEIGHT):
                             ui.Rectangle(style={"background_color": 0xFF000000})
                             ui.Label("AIRCRAFT ANTENNA STATUS MONITOR", style={"font_size": 24, "color": 0xFFFFFFFF, "font_weight": "bold", "margin": 20})
                         
-                        ui.Spacer(height=12)
+                        ui.Spacer(height=_TITLE_GAP)
                         
                         # Header Row
-                        with ui.ZStack(height=42):
+                        with ui.ZStack(height=_HEADER_HEIGHT):
                             ui.Rectangle(style={"background_color": 0xFF000000})
                             with ui.HStack():
-                                ui.Spacer(width=20)
-                                ui.Label("ANTENNA", width=220, style={"font_weight": "bold"}).set_tooltip("Aircraft antenna identifier\nEach antenna has a unique designation\nbased on its function and location on the aircraft")
-                                ui.Label("STATE", width=130, style={"font_weight": "bold"}).set_tooltip("Current signal state:\nON (operational)\nDEGRADED (partial signal)\nOFF (no signal)")
-                                ui.Label("TYPE", width=160, style={"font_weight": "bold"}).set_tooltip("Antenna system type\nIndicates the communication or navigation\nsystem this antenna belongs to")
-                                ui.Label("FREQUENCY", width=150, style={"font_weight": "bold"}).set_tooltip("Operating frequency band\nThe radio frequency range this antenna\ntransmits and receives on")
-                                ui.Label("LOS", width=65, style={"font_weight": "bold"}).set_tooltip("Line of Sight Required\nYES: needs clear view of sky/transmitter\nNO: can work through obstacles")
-                                ui.Label("LOCKED", width=80, style={"font_weight": "bold"}).set_tooltip("Policy Locked\nYES: subject to security policy,\ndisabled in secure zones\nNO: ignores security restrictions")
-                                ui.Label("CURRENT ZONE", width=150, style={"font_weight": "bold"}).set_tooltip("Current RF policy zone:\nRF BLOCKING (signal blocked)\nRF ATTENUATION (signal degraded)\nSECURE+LOCKED (security zone active)\nSECURE ZONE (in security area)\nCLEAR (no restrictions)")
-                                ui.Label("POSITION (X, Y, Z)", width=0, style={"font_weight": "bold"}).set_tooltip("World-space coordinates of antenna in centimeters\nUpdates in real-time as aircraft moves")
+                                ui.Spacer(width=_TOWER_LEFT_MARGIN)
+                                for name, width in _HEADER_COLUMNS:
+                                    ui.Label(name, width=width, style=_BOLD).set_tooltip(_HEADER_TOOLTIPS[name])
                         
-                        # Antenna Data Rows
-                        for idx, ant_name in enumerate(self.ANTENNA_NAMES):
-                            bg = 0xFF303030 if idx % 2 == 0 else 0xFF1A1A1A
-                            with ui.ZStack(height=48):
-                                ui.Rectangle(style={"background_color": bg})
-                                with ui.HStack():
-                                    ui.Spacer(width=20)
-                                    l = ui.Label(ant_name, width=220)
-                                    l.set_tooltip(self.ANTENNA_DESCRIPTIONS.get(ant_name, ""))
-                                    with ui.HStack(width=130, spacing=8):
-                                        with ui.VStack(width=18):
-                                            ui.Spacer()
-                                            c = ui.Circle(width=18, height=18)
-                                            ui.Spacer()
-                                        s = ui.Label("ON", width=100, style={"font_weight": "bold"})
-                                    t = ui.Label("TYPE", width=160)
-                                    f = ui.Label("FREQ", width=150)
-                                    lo = ui.Label("NO", width=65)
-                                    lk = ui.Label("NO", width=80)
-                                    z = ui.Label("CLEAR", width=150)
-                                    p = ui.Label("(0,0,0)")
-                                    self._ui_elements[ant_name] = {
-                                        "circle": c,
-                                        "state_label": s,
-                                        "locked_label": lk,
-                                        "zone_label": z,
-                                        "pos_label": p
-                                    }
+                        # Antenna Data Rows, with every status disk drawn by one overlaid image
+                        with ui.ZStack(height=_ROW_HEIGHT * len(self._ui_names)):
+                            with ui.VStack(spacing=0):
+                                for idx, ant_name in enumerate(self._ui_names):
+                                    with ui.ZStack(height=_ROW_HEIGHT):
+                                        ui.Rectangle(style=_ROW_STYLES[idx & 1])
+                                        with ui.HStack():
+                                            ui.Spacer(width=_TOWER_LEFT_MARGIN)
+                                            l = ui.Label(ant_name, width=_HEADER_COLUMNS[0][1])
+                                            l.set_tooltip(self._ANT_TOOLTIPS[idx])
+                                            with ui.HStack(width=130, spacing=8):
+                                                ui.Spacer(width=_STATUS_DOT)  # Status disk slot, filled by the overlay
+                                                s = ui.Label("ON", width=100, style=_BOLD)
+                                            t = ui.Label("TYPE", width=160)
+                                            f = ui.Label("FREQ", width=150)
+                                            lo = ui.Label("NO", width=65)
+                                            lk = ui.Label("NO", width=80)
+                                            z = ui.Label("CLEAR", width=150)
+                                            p = ui.Label("(0,0,0)")
+                                            self._ui_state_labels.append(s)
+                                            self._ui_locked_labels.append(lk)
+                                            self._ui_zone_labels.append(z)
+                                            self._ui_pos_labels.append(p)
+                            with ui.HStack():
+                                ui.Spacer(width=_TOWER_STATUS_X)
+                                ui.ImageWithProvider(
+                                    self._status_provider,
+                                    width=_STATUS_DOT,
+                                    height=_ROW_HEIGHT * len(self._ui_names),
+                                    fill_policy=ui.IwpFillPolicy.IWP_STRETCH
+                                )
+                                ui.Spacer()
                         
                         ui.Spacer(height=20)
                         
@@ -837,14 +1266,7 @@ class Airport_Extension(omni.ext.IExt):
                                         ui.Label(label, style={"font_size": 13, "color": 0xFFCCCCCC})
                                 ui.Spacer()
         
-        # Subscribe to update loop
-        stream = omni.kit.app.get_app().get_update_event_stream()
-        self._control_tower_subscription = stream.create_subscription_to_pop(
-            self.tower_master_update,
-            name="control_tower_dashboard_update"
-        )
-        
-        print("[Control Tower] Started - Dashboard active")
+        self._tower_built = True
     
     # ==================== SHUTDOWN ====================
     
@@ -854,16 +1276,16 @@ class Airport_Extension(omni.ext.IExt):
         print("AIRPORT EXTENSION SHUTTING DOWN")
         print("="*70)
         
-        if self._rf_subscription:
-            self._rf_subscription.unsubscribe()
-            self._rf_subscription = None
-            print("✓ RF visualization stopped")
+        self._rf_enabled = False
+        self._tower_enabled = False
+        if self._tick_sub:
+            self._tick_sub.unsubscribe()
+            self._tick_sub = None
+            print("✓ RF visualization and control tower stopped")
         
-        if self._control_tower_subscription:
-            self._control_tower_subscription.unsubscribe()
-            self._control_tower_subscription = None
-            print("✓ Control tower stopped")
+        self._unbind_stage()
         
+        self._destroy_slider_throttles()
         if self._waypoint_nav_window:
             self._waypoint_nav_window.destroy()
             self._waypoint_nav_window = None
@@ -872,6 +1294,7 @@ class Airport_Extension(omni.ext.IExt):
         if self._control_tower_window:
             self._control_tower_window.destroy()
             self._control_tower_window = None
+            self._tower_built = False
             print("✓ Control tower window closed")
         
         print("="*70 + "\n")